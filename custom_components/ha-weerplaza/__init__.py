@@ -1,20 +1,46 @@
+import asyncio
 import logging
 import os
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.const import Platform
-from .const import DOMAIN, DEBUG_FILE_NAME
+from .const import DOMAIN, DEBUG_FILE_NAME, MAX_CONCURRENT_FETCHES
 from .coordinator import WeerplazaCoordinator
 from .cache import PersistentCache
 
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS = [Platform.SENSOR]
 
+def _coordinators(hass: HomeAssistant):
+    return [
+        value for value in hass.data.get(DOMAIN, {}).values()
+        if isinstance(value, WeerplazaCoordinator)
+    ]
+
 async def async_setup(hass: HomeAssistant, config: dict):
+    # --- Register Service Calls ---
+    # Services act on every configured location, fanned out concurrently
+    async def handle_manual_refresh(call: ServiceCall):
+        await asyncio.gather(
+            *(coordinator.async_request_refresh() for coordinator in _coordinators(hass))
+        )
+
+    async def handle_clear_cache(call: ServiceCall):
+        await asyncio.gather(
+            *(coordinator.cache.clear() for coordinator in _coordinators(hass) if coordinator.cache)
+        )
+        _LOGGER.info("Weerplaza cache cleared")
+
+    hass.services.async_register(DOMAIN, "manual_refresh", handle_manual_refresh)
+    hass.services.async_register(DOMAIN, "clear_cache", handle_clear_cache)
+
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     hass.data.setdefault(DOMAIN, {})
+    # Shared by all entries to cap concurrent requests to weerplaza.nl
+    if "_fetch_sem" not in hass.data[DOMAIN]:
+        hass.data[DOMAIN]["_fetch_sem"] = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
 
     cache = PersistentCache(hass, f"{DOMAIN}_{entry.entry_id}")
     initial_data = await cache.load()
@@ -23,7 +49,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         hass,
         config_entry=entry,
         cache=cache,
-        initial_data=initial_data
+        initial_data=initial_data,
+        fetch_semaphore=hass.data[DOMAIN]["_fetch_sem"]
     )
 
     # --- L1 PERSISTENCE LOGIC ---
@@ -41,17 +68,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    # --- Register Service Calls ---
-    async def handle_manual_refresh(call: ServiceCall):
-        await coordinator.async_request_refresh()
-
-    async def handle_clear_cache(call: ServiceCall):
-        await cache.clear()
-        _LOGGER.info("Weerplaza cache cleared")
-
-    hass.services.async_register(DOMAIN, "manual_refresh", handle_manual_refresh)
-    hass.services.async_register(DOMAIN, "clear_cache", handle_clear_cache)
-
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
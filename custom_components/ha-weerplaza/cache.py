@@ -3,6 +3,8 @@ from homeassistant.helpers.storage import Store
 class PersistentCache:
     """Simple storage for last known data."""
 
+    __slots__ = ("store",)
+
     def __init__(self, hass, key):
         self.store = Store(hass, 1, key)
 
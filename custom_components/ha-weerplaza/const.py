@@ -7,3 +7,5 @@ CONF_SCAN_INTERVAL: Final = "scan_interval"
 DEFAULT_SCAN_INTERVAL: Final = 1800
 BASE_URL: Final = "https://www.weerplaza.nl/"
 DEBUG_FILE_NAME: Final = "weerplaza_debug.txt"
+MAX_CONCURRENT_FETCHES: Final = 2
+STARTUP_JITTER: Final = 30
@@ -1,11 +1,20 @@
+import hashlib
 import logging
 import random
 import os
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from datetime import timedelta
+import orjson
 import aiohttp
 import asyncio
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from .const import DOMAIN, BASE_URL, DEBUG_FILE_NAME
+from homeassistant.util import dt as dt_util, slugify
+from .const import (
+    DOMAIN, BASE_URL, DEBUG_FILE_NAME, MAX_CONCURRENT_FETCHES, STARTUP_JITTER,
+    CONF_INSTANCE_NAME, CONF_LOCATION_PATH,
+)
 from .parser import WeerplazaParser
 
 _LOGGER = logging.getLogger(__name__)
@@ -14,12 +23,39 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Safari/605.1.15"
 ]
+# One read-only header set per user agent, built once at import
+REQUEST_HEADERS = tuple(
+    MappingProxyType({"User-Agent": user_agent, "Accept": "text/html,application/xhtml+xml"})
+    for user_agent in USER_AGENTS
+)
+CHUNK_SIZE = 16384
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5)
+# Bytes any forecast page contains; without them there is nothing to parse
+PAGE_MARKERS = (b"location-widget", b"hourly")
 
 class WeerplazaCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass, config_entry, cache=None, initial_data=None):
+    def __init__(self, hass, config_entry, cache=None, initial_data=None, fetch_semaphore=None):
         self.config_entry = config_entry
-        self.location_path = config_entry.data["location_path"]
+        self.location_path = config_entry.data[CONF_LOCATION_PATH]
+        self.instance_name = config_entry.data[CONF_INSTANCE_NAME]
+        self.slug = slugify(self.instance_name)
+        # Shared by every entity of this entry
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=self.instance_name,
+            manufacturer="Weerplaza",
+            model=f"Location: {self.location_path}",
+            configuration_url=f"{BASE_URL}{self.location_path.strip('/')}/",
+        )
         self.cache = cache
+        self._session = async_get_clientsession(hass)
+        self._fetch_semaphore = fetch_semaphore or asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._startup_jitter = True
+        # HTTP validators of the last parsed page, for conditional requests
+        self._etag = None
+        self._last_modified = None
+        self._last_body_hash = None
+        self._last_data_blob = None
         
         # Prime the coordinator with initial data immediately
         self.data = initial_data
@@ -35,48 +71,121 @@ class WeerplazaCoordinator(DataUpdateCoordinator):
         )
         self._error_count = 0
 
-    def _save_debug_output(self, text_content):
+    def _save_debug_output(self, html):
         path = os.path.join(os.path.dirname(__file__), DEBUG_FILE_NAME)
+        if isinstance(html, str):
+            html = html.encode("utf-8")
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(text_content)
+            with open(path, "wb") as f:
+                f.write(html)
         except Exception as e:
             _LOGGER.error(f"Failed to write debug file: {e}")
 
+    def _parse_html(self, html):
+        """Write the debug dump and parse the page; runs in the executor."""
+        self._save_debug_output(html)
+        return WeerplazaParser(html).extract_data()
+
+    def _reuse_last_data(self):
+        """Return the last known data, stamped with the time of this scrape."""
+        data = dict(self._last_data)
+        data["laatste_scrape_tijd"] = dt_util.now().strftime("%d-%m-%Y %H:%M:%S")
+        self._last_data = data
+        self._error_count = 0
+        return data
+
     async def _async_update_data(self):
-        # Small delay to prevent network congestion on boot
-        await asyncio.sleep(random.randint(1, 3))
+        # Spread the first scrape of each entry so restarts don't hit
+        # weerplaza.nl all at once; skipped when setup is waiting for data
+        if self._startup_jitter:
+            self._startup_jitter = False
+            if self._last_data:
+                await asyncio.sleep(
+                    random.uniform(0, min(STARTUP_JITTER, self.update_interval.total_seconds()))
+                )
 
-        headers = {
-            "User-Agent": random.choice(USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml",
-        }
+        headers = random.choice(REQUEST_HEADERS)
+        if self._last_data and (self._etag or self._last_modified):
+            headers = dict(headers)
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
 
         scrape_url = f"{BASE_URL}{self.location_path.strip('/')}/"
 
         try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(scrape_url, timeout=20) as response:
+            # Only the download holds the shared slot; parsing happens after
+            async with self._fetch_semaphore:
+                async with self._session.get(scrape_url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+                    if response.status == 304 and self._last_data:
+                        _LOGGER.debug("Page for %s not modified, keeping last data", self.location_path)
+                        return self._reuse_last_data()
+
                     if response.status != 200:
                         raise UpdateFailed(f"Server returned {response.status}")
 
-                    html_content = await response.text()
-                    self._save_debug_output(html_content)
-
-                    parser = WeerplazaParser(html_content)
-                    new_data = parser.extract_data()
-                    
-                    # Add timestamp
-                    new_data["laatste_scrape_tijd"] = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-                    
-                    # Store locally and save to disk
-                    self._last_data = new_data
-                    if self.cache:
-                        await self.cache.save(new_data)
-                    
-                    return new_data
+                    # Hash the body while it streams in, so only the parse is left
+                    # once the last chunk arrives
+                    digest = hashlib.blake2b(digest_size=16)
+                    chunks = []
+                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                        digest.update(chunk)
+                        chunks.append(chunk)
+                    body = b"".join(chunks)
+
+                    charset = response.charset
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+
+            # Identical bytes parse to identical data, skip the parser
+            body_hash = digest.digest()
+            if body_hash == self._last_body_hash and self._last_data:
+                _LOGGER.debug("Page for %s unchanged, keeping last data", self.location_path)
+                return self._reuse_last_data()
+
+            # Error and placeholder pages come back as 200 too; reject them
+            # before building a DOM
+            if not any(marker in body for marker in PAGE_MARKERS):
+                raise UpdateFailed(f"No forecast found on page for {self.location_path}")
+
+            # Lexbor parses UTF-8 bytes directly (weerplaza serves UTF-8), so
+            # only a page declaring another charset is decoded to str first
+            if charset and charset.lower().replace("-", "") != "utf8":
+                html = body.decode(charset, errors="replace")
+            else:
+                html = body
+
+            # File I/O and parsing are blocking, keep them off the event loop
+            new_data = await self.hass.async_add_executor_job(
+                self._parse_html, html
+            )
+
+            self._etag = etag
+            self._last_modified = last_modified
+            self._last_body_hash = body_hash
+
+            # Pages often differ only in markup; compare the parsed content
+            # through its canonical serialisation
+            blob = orjson.dumps(new_data, option=orjson.OPT_SORT_KEYS)
+            changed = blob != self._last_data_blob
+            self._last_data_blob = blob
+
+            # Add timestamp
+            new_data["laatste_scrape_tijd"] = dt_util.now().strftime("%d-%m-%Y %H:%M:%S")
+
+            # Store locally and save to disk when the content changed
+            self._last_data = new_data
+            if self.cache and changed:
+                await self.cache.save(new_data)
+
+            self._error_count = 0
+            return new_data
 
         except Exception as err:
+            # Counted so the Status sensor reports the failure while the
+            # entities stay available on the last known data
+            self._error_count += 1
             _LOGGER.warning(f"Update failed, using last known data: {err}")
             if self._last_data:
                 return self._last_data
@@ -1,14 +1,95 @@
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import re
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# Top-level page sections as (key, tag, attribute, needle). Classes match on
+# substring, ids exactly; all are collected in a single selector walk.
+SECTIONS = (
+    ("splash", "a", "class", "btn-splash"),
+    ("flash", "a", "class", "btn-flash"),
+    ("warning", "div", "class", "meteo-warning-block"),
+    ("astro", "div", "class", "forecast-astro"),
+    ("hourly", "div", "id", "hourly"),
+    ("daily", "div", "id", "fullday"),
+    ("widget", "div", "class", "location-widget"),
+)
+SECTIONS_SELECTOR = ", ".join(
+    f'{tag}[{attr}{"*=" if attr == "class" else "="}"{needle}"]' for _, tag, attr, needle in SECTIONS
+)
+URL_RE = re.compile(r"url\(['\"]?(.*?)['\"]?\)")
+NUMBER_RE = re.compile(r"(\d+)")
+CLOCK_RE = re.compile(r"(\d{2}:\d{2})")
+# Per-item parts, fetched with one selector walk per hour / day cell
+HOUR_PARTS_SELECTOR = "div[class*=head], div.wx, div[class*=temp]"
+DAY_PARTS_SELECTOR = "div.show-large, div.hide-large, div.wx, div.red.temp, div.blue.temp"
+MOON_PHASES = tuple(
+    (name, re.compile(name, re.I))
+    for name in ("Eerste kwartier", "Volle maan", "Laatste kwartier", "Nieuwe maan")
+)
+
 class WeerplazaParser:
+    __slots__ = ("tree", "sections")
+
     def __init__(self, html):
-        self.soup = BeautifulSoup(html, "lxml")
-        for element in self.soup(["script", "style", "noscript", "meta"]):
-            element.extract()
+        self.tree = LexborHTMLParser(html)
+        self.tree.strip_tags(["script", "style", "noscript", "meta"])
+        self.sections = self._index_sections()
+
+    def _index_sections(self):
+        """Map each section key to its first node, walking the tree once."""
+        sections = {}
+        for node in self.tree.css(SECTIONS_SELECTOR):
+            for key, tag, attr, needle in SECTIONS:
+                if key in sections or node.tag != tag:
+                    continue
+                value = node.attributes.get(attr) or ""
+                if (needle in value) if attr == "class" else (value == needle):
+                    sections[key] = node
+                    break
+            if len(sections) == len(SECTIONS):
+                break
+        else:
+            _LOGGER.debug(
+                "Sections not found on page: %s",
+                ", ".join(key for key, *_ in SECTIONS if key not in sections),
+            )
+        return sections
+
+    @staticmethod
+    def _to_float(text, default=None):
+        """Parse a scraped temperature once, so one bad value can't drop a section."""
+        if not text:
+            return default
+        try:
+            return float(text)
+        except ValueError:
+            _LOGGER.debug("Unparseable temperature %r", text)
+            return default
+
+    @staticmethod
+    def _icon_url(wx):
+        """Return the background-image url of a weather icon div."""
+        match = URL_RE.search(wx.attributes.get("style") or "") if wx else None
+        return match.group(1) if match else ""
+
+    @staticmethod
+    def _find_text_node(node, pattern):
+        """Return the first text node below node whose content matches pattern."""
+        for child in node.traverse(include_text=True):
+            if child.is_text_node and pattern.search(child.text_content or ""):
+                return child
+        return None
+
+    @staticmethod
+    def _find_parent_col(node):
+        parent = node.parent
+        while parent is not None:
+            if parent.tag == "div" and "col" in (parent.attributes.get("class") or "").split():
+                return parent
+            parent = parent.parent
+        return None
 
     def extract_data(self):
         scraped_data = {
@@ -29,29 +110,29 @@ class WeerplazaParser:
         # 1. FLASH + SPLASH + ALERTS
         try:
             alerts_list = []
-            splash = self.soup.find("a", class_=re.compile("btn-splash"))
+            splash = self.sections.get("splash")
             if splash:
-                s_text = splash.find("span", class_="text")
+                s_text = splash.css_first("span.text")
                 if s_text:
-                    scraped_data["rain"] = s_text.get_text(strip=True)
+                    scraped_data["rain"] = s_text.text(strip=True)
                     alerts_list.append(f"Regen: {scraped_data['rain']}")
 
-            flash = self.soup.find("a", class_=re.compile("btn-flash"))
+            flash = self.sections.get("flash")
             if flash:
-                f_text = flash.find("span", class_="text")
+                f_text = flash.css_first("span.text")
                 if f_text:
-                    detect_text = f_text.get_text(strip=True)
+                    detect_text = f_text.text(strip=True)
                     scraped_data["flash_detection"] = detect_text
-                    range_match = re.search(r"(\d+)", detect_text)
+                    range_match = NUMBER_RE.search(detect_text)
                     if range_match:
                         scraped_data["flash_range"] = int(range_match.group(1))
                     alerts_list.append(f"Onweer: {detect_text}")
 
-            warning_block = self.soup.find("div", class_="meteo-warning-block")
+            warning_block = self.sections.get("warning")
             if warning_block:
-                w_text = warning_block.find("span", class_="text")
+                w_text = warning_block.css_first("span.text")
                 if w_text:
-                    scraped_data["alerts"] = w_text.get_text(strip=True)
+                    scraped_data["alerts"] = w_text.text(strip=True)
 
             if alerts_list:
                 scraped_data["flash_message"] = {"message": " | ".join(alerts_list)}
@@ -60,25 +141,25 @@ class WeerplazaParser:
 
         # 2. ASTRO (SUN & MOON)
         try:
-            astro_block = self.soup.find("div", class_=re.compile("forecast-astro"))
+            astro_block = self.sections.get("astro")
             if astro_block:
                 for label, key in [("Zon op", "rise"), ("Zon onder", "set")]:
-                    tag = astro_block.find("b", string=re.compile(label, re.I))
+                    # Case-insensitive text match inside the selector engine
+                    tag = astro_block.css_first(f'b:lexbor-contains("{label}" i)')
                     if tag and tag.parent:
-                        full_text = tag.parent.get_text(separator=" ", strip=True)
-                        match = re.search(r"(\d{2}:\d{2})", full_text)
+                        full_text = tag.parent.text(separator=" ", strip=True)
+                        match = CLOCK_RE.search(full_text)
                         if match:
                             scraped_data["astro"]["sun"][key] = match.group(1)
 
-                phases = ["Eerste kwartier", "Volle maan", "Laatste kwartier", "Nieuwe maan"]
-                for p_name in phases:
-                    p_tag = astro_block.find(string=re.compile(p_name, re.I))
+                for p_name, p_re in MOON_PHASES:
+                    p_tag = self._find_text_node(astro_block, p_re)
                     if p_tag:
-                        container = p_tag.find_parent("div", class_="col") or p_tag.parent
-                        img = container.find("img")
-                        full_text = container.get_text(separator=" ", strip=True)
+                        container = self._find_parent_col(p_tag) or p_tag.parent
+                        img = container.css_first("img")
+                        full_text = container.text(separator=" ", strip=True)
                         date_val = full_text.replace(p_name, "").strip()
-                        icon_path = img.get("src") if img else ""
+                        icon_path = (img.attributes.get("src") or "") if img else ""
                         if icon_path and icon_path.startswith("/"):
                             icon_path = f"https://www.weerplaza.nl{icon_path}"
                         scraped_data["moon_phases"].append({
@@ -89,35 +170,41 @@ class WeerplazaParser:
 
         # 3. HOURLY FORECAST
         try:
-            hourly_container = self.soup.find("div", id="hourly")
+            hourly_container = self.sections.get("hourly")
             if hourly_container:
-                for hour_div in hourly_container.find_all("div", class_="hour"):
-                    head = hour_div.find("div", class_=re.compile("head"))
-                    time_val = head.find_all("div")[-1].get_text(strip=True) if head else "--:--"
-                    wx_div = hour_div.find("div", class_="wx")
-                    icon_match = re.search(r"url\(['\"]?(.*?)['\"]?\)", wx_div.get("style", "")) if wx_div else None
-                    temp_div = hour_div.find("div", class_=re.compile("temp"))
-                    temp_str = temp_div.get_text(strip=True).replace("\u00b0C", "") if temp_div else None
+                for hour_div in hourly_container.css("div.hour"):
+                    head = wx_div = temp_div = None
+                    for part in hour_div.css(HOUR_PARTS_SELECTOR):
+                        classes = part.attributes.get("class") or ""
+                        if head is None and "head" in classes:
+                            head = part
+                        if wx_div is None and "wx" in classes.split():
+                            wx_div = part
+                        if temp_div is None and "temp" in classes:
+                            temp_div = part
+                    time_val = head.css("div")[1:][-1].text(strip=True) if head else "--:--"
+                    temp_str = temp_div.text(strip=True).replace("\u00b0C", "") if temp_div else None
                     scraped_data["hourly_forecast"].append({
                         "time": time_val,
-                        "temperature": float(temp_str) if temp_str else "-",
-                        "icon": icon_match.group(1) if icon_match else ""
+                        "temperature": self._to_float(temp_str, "-"),
+                        "icon": self._icon_url(wx_div)
                     })
         except Exception:
             pass
 
         # 4. DAILY FORECAST SUMMARY (MATCHING BY DATA-DAY)
         try:
-            daily_section = self.soup.find("div", id="fullday")
+            daily_section = self.sections.get("daily")
             if daily_section:
                 day_map = {}
                 # Extract all unique data-day values to preserve order
-                all_cells = daily_section.find_all("td", attrs={"data-day": True})
+                all_cells = daily_section.css("td[data-day]")
                 
                 for cell in all_cells:
-                    day_id = cell["data-day"]
-                    if day_id not in day_map:
-                        day_map[day_id] = {
+                    day_id = cell.attributes["data-day"]
+                    day = day_map.get(day_id)
+                    if day is None:
+                        day = day_map[day_id] = {
                             "date_short": "-",
                             "description_icon_title": "-",
                             "temp_high": "-",
@@ -125,39 +212,46 @@ class WeerplazaParser:
                             "icon": ""
                         }
                     
+                    show_large = hide_large = wx = red_temp = blue_temp = None
+                    for part in cell.css(DAY_PARTS_SELECTOR):
+                        classes = (part.attributes.get("class") or "").split()
+                        if show_large is None and "show-large" in classes:
+                            show_large = part
+                        if hide_large is None and "hide-large" in classes:
+                            hide_large = part
+                        if wx is None and "wx" in classes:
+                            wx = part
+                        if "temp" in classes:
+                            if red_temp is None and "red" in classes:
+                                red_temp = part
+                            if blue_temp is None and "blue" in classes:
+                                blue_temp = part
+
                     # 4a. Get Day Name & Date
-                    head = cell.find("div", class_="show-large") or cell.find("div", class_="hide-large")
+                    head = show_large or hide_large
                     if head:
-                        day_name = head.find(string=True, recursive=False)
+                        day_name = next((n.text_content for n in head.iter(include_text=True) if n.is_text_node), None)
                         day_name = day_name.strip() if day_name else ""
-                        date_div = head.find("div")
-                        date_txt = date_div.get_text(strip=True) if date_div else ""
-                        day_map[day_id]["date_short"] = f"{day_name} {date_txt}".strip().capitalize()
+                        # css() matches the head div itself first; skip it
+                        date_div = next(iter(head.css("div")[1:]), None)
+                        date_txt = date_div.text(strip=True) if date_div else ""
+                        day["date_short"] = f"{day_name} {date_txt}".strip().capitalize()
 
                     # 4b. Get Icon & Description
-                    wx = cell.find("div", class_="wx")
                     if wx:
-                        icon_match = re.search(r"url\(['\"]?(.*?)['\"]?\)", wx.get("style", ""))
-                        day_map[day_id]["icon"] = icon_match.group(1) if icon_match else ""
-                        day_map[day_id]["description_icon_title"] = wx.get("title", "Verwachting")
+                        day["icon"] = self._icon_url(wx)
+                        day["description_icon_title"] = wx.attributes.get("title") or "Verwachting"
 
                     # 4c. Get Temperatures (Red = Max, Blue = Min)
                     # We replace the degree symbol safely using Unicode \u00b0
-                    red_temp = cell.find("div", class_="red temp")
                     if red_temp:
-                        day_map[day_id]["temp_high"] = red_temp.get_text(strip=True).replace("\u00b0C", "").replace("\u00b0", "").strip()
+                        day["temp_high"] = red_temp.text(strip=True).replace("\u00b0C", "").replace("\u00b0", "").strip()
                     
-                    blue_temp = cell.find("div", class_="blue temp")
                     if blue_temp:
-                        day_map[day_id]["temp_low"] = blue_temp.get_text(strip=True).replace("\u00b0C", "").replace("\u00b0", "").strip()
+                        day["temp_low"] = blue_temp.text(strip=True).replace("\u00b0C", "").replace("\u00b0", "").strip()
 
-                # Convert map back to list in original order
-                seen_ids = []
-                for cell in all_cells:
-                    d_id = cell["data-day"]
-                    if d_id not in seen_ids:
-                        scraped_data["daily_forecast_summary"].append(day_map[d_id])
-                        seen_ids.append(d_id)
+                # Dicts keep insertion order, which is the page order of the days
+                scraped_data["daily_forecast_summary"].extend(day_map.values())
         except Exception as e:
             _LOGGER.debug(f"Daily parsing error: {e}")
 
@@ -167,17 +261,17 @@ class WeerplazaParser:
 
         # 5. CURRENT WEATHER
         try:
-            widget = self.soup.find("div", class_=re.compile("location-widget"))
+            widget = self.sections.get("widget")
             if widget:
-                wx = widget.find("div", class_=re.compile("wx"))
-                temp_span = widget.find("span", class_="temp")
-                temp_val = float(temp_span.get_text(strip=True).replace("\u00b0", "")) if temp_span else None
-                icon_m = re.search(r"url\(['\"]?(.*?)['\"]?\)", wx.get("style", "")) if wx else None
+                wx = widget.css_first("div[class*=wx]")
+                temp_span = widget.css_first("span.temp")
+                title = widget.css_first("h2")
+                temp_val = self._to_float(temp_span.text(strip=True).replace("\u00b0", "")) if temp_span else None
                 scraped_data["current_weather"] = {
-                    "description_icon_title": wx.get("title", "Onbekend") if wx else "Onbekend",
+                    "description_icon_title": (wx.attributes.get("title") or "Onbekend") if wx else "Onbekend",
                     "temperature": temp_val,
-                    "location_name_observed": widget.find("h2").get_text(strip=True).replace("Het weer nu in ", "") if widget.find("h2") else "Weerplaza",
-                    "icon": icon_m.group(1) if icon_m else ""
+                    "location_name_observed": title.text(strip=True).replace("Het weer nu in ", "") if title else "Weerplaza",
+                    "icon": self._icon_url(wx)
                 }
                 scraped_data["current_temperature"] = temp_val
         except Exception:
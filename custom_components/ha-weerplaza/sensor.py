@@ -1,90 +1,130 @@
 import logging
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from collections.abc import Callable
+from dataclasses import dataclass
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription, SensorDeviceClass
 from homeassistant.const import UnitOfTemperature, EntityCategory
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import callback
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
-from .const import DOMAIN, CONF_INSTANCE_NAME, CONF_LOCATION_PATH
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Scraped keys exposed on the master sensor, with the value used when missing
+MASTER_ATTRIBUTES = (
+    ("current_weather", {}),
+    ("hourly_forecast", []),
+    ("daily_forecast_summary", []),
+    ("daypart_forecast", []),
+    ("flash_message", {}),
+    ("flash_detection", None),
+    ("flash_range", None),
+    ("rain", None),
+    ("alerts", None),
+    ("astro", {}),
+    ("moon_phases", []),
+)
+
+def _status_value(coordinator):
+    return "Fout" if coordinator._error_count > 0 else "OK"
+
+def _last_update_value(coordinator):
+    data = coordinator.data or {}
+    if "laatste_scrape_tijd" not in data and data:
+        return "Uit Cache (Wacht op timer)"
+    return data.get("laatste_scrape_tijd", "Onbekend")
+
+@dataclass(frozen=True, kw_only=True)
+class WeerplazaDiagnosticDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor and how to compute its state."""
+
+    value_fn: Callable[..., StateType]
+
+DIAGNOSTIC_SENSORS = (
+    WeerplazaDiagnosticDescription(
+        key="status",
+        name="Status",
+        icon="mdi:check-network",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_status_value,
+    ),
+    WeerplazaDiagnosticDescription(
+        key="laatste_update",
+        name="Laatste Update",
+        icon="mdi:clock",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_last_update_value,
+    ),
+)
+
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    instance_name = entry.data[CONF_INSTANCE_NAME]
-    location_path = entry.data[CONF_LOCATION_PATH]
-    instance_slug = slugify(instance_name)
-
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, entry.entry_id)},
-        name=instance_name,
-        manufacturer="Weerplaza",
-        model=f"Location: {location_path}",
-        configuration_url=f"https://www.weerplaza.nl/{location_path.strip('/')}/",
-    )
 
-    entities = [
-        WeerplazaMasterSensor(coordinator, instance_name, instance_slug, device_info),
-        WeerplazaDiagnosticSensor(coordinator, instance_name, instance_slug, device_info, "Status"),
-        WeerplazaDiagnosticSensor(coordinator, instance_name, instance_slug, device_info, "Laatste Update")
-    ]
+    entities = (
+        WeerplazaMasterSensor(coordinator),
+        *(WeerplazaDiagnosticSensor(coordinator, description) for description in DIAGNOSTIC_SENSORS),
+    )
 
     async_add_entities(entities)
 
-class WeerplazaMasterSensor(CoordinatorEntity, SensorEntity):
+class WeerplazaBaseEntity(CoordinatorEntity, SensorEntity):
+    """Copies coordinator data into _attr_* once per update instead of on every read."""
+
+    # Updates are pushed by the coordinator
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, unique_id_suffix):
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.slug}_{unique_id_suffix}"
+        # One DeviceInfo per entry, shared by reference
+        self._attr_device_info = coordinator.device_info
+
+    async def async_added_to_hass(self):
+        self._update_from_coordinator()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self):
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+class WeerplazaMasterSensor(WeerplazaBaseEntity):
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_icon = "mdi:weather-partly-cloudy"
+    # The forecast lists are big and change every scrape; keep them out of
+    # the recorder (they can exceed its 16 KiB attribute limit)
+    _unrecorded_attributes = frozenset({
+        "hourly_forecast",
+        "daily_forecast_summary",
+        "daypart_forecast",
+        "astro",
+        "moon_phases",
+    })
 
-    def __init__(self, coordinator, name, slug, device_info):
-        super().__init__(coordinator)
-        self._attr_name = f"weerplaza {name} current weather"
-        self._attr_unique_id = f"{slug}_master_weather"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self):
-        data = self.coordinator.data or {}
-        return data.get("current_temperature")
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        data = self.coordinator.data or {}
-        return {
-            "current_weather": data.get("current_weather", {}),
-            "hourly_forecast": data.get("hourly_forecast", []),
-            "daily_forecast_summary": data.get("daily_forecast_summary", []),
-            "daypart_forecast": data.get("daypart_forecast", []),
-            "flash_message": data.get("flash_message", {}),
-            "flash_detection": data.get("flash_detection"),
-            "flash_range": data.get("flash_range"),
-            "rain": data.get("rain"),
-            "alerts": data.get("alerts"),
-            "astro": data.get("astro", {}),
-            "moon_phases": data.get("moon_phases", [])
+    def __init__(self, coordinator):
+        super().__init__(coordinator, "master_weather")
+        self._attr_name = f"weerplaza {coordinator.instance_name} current weather"
+
+    def _update_from_coordinator(self):
+        data = self.coordinator.data
+        if not data:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {key: default for key, default in MASTER_ATTRIBUTES}
+            return
+
+        self._attr_native_value = data.get("current_temperature")
+        self._attr_extra_state_attributes = {
+            key: data.get(key, default) for key, default in MASTER_ATTRIBUTES
         }
 
-class WeerplazaDiagnosticSensor(CoordinatorEntity, SensorEntity):
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+class WeerplazaDiagnosticSensor(WeerplazaBaseEntity):
+    entity_description: WeerplazaDiagnosticDescription
 
-    def __init__(self, coordinator, name, slug, device_info, sensor_type):
-        super().__init__(coordinator)
-        self.sensor_type = sensor_type
-        self._attr_name = f"{name} {sensor_type}"
-        self._attr_unique_id = f"{slug}_{sensor_type.lower().replace(' ', '_')}"
-        self._attr_device_info = device_info
-
-        if sensor_type == "Laatste Update":
-            self._attr_icon = "mdi:clock"
-        else:
-            self._attr_icon = "mdi:check-network"
-
-    @property
-    def native_value(self):
-        if self.sensor_type == "Status":
-            return "Fout" if self.coordinator._error_count > 0 else "OK"
-        if self.sensor_type == "Laatste Update":
-            data = self.coordinator.data or {}
-            if "laatste_scrape_tijd" not in data and data:
-                 return "Uit Cache (Wacht op timer)"
-            return data.get("laatste_scrape_tijd", "Onbekend")
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+        self._attr_name = f"{coordinator.instance_name} {description.name}"
+
+    def _update_from_coordinator(self):
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator)